@@ -1,4 +1,5 @@
 """A collection of material properties for concrete"""
+import functools
 import math
 
 
@@ -21,6 +22,7 @@ def fcm(fck: float, delta_f: float = 8.0) -> float:
     return abs(fck) + abs(delta_f)
 
 
+@functools.lru_cache(maxsize=128)
 def fctm(fck: float) -> float:
     """Compute the mean concrete tensile strength from the characteristic
     compressive strength.
@@ -68,6 +70,7 @@ def fctkmax(_fctm: float) -> float:
     return 1.3 * _fctm
 
 
+@functools.lru_cache(maxsize=128)
 def Gf(fck: float) -> float:
     """Compute tensile fracture energy from characteristic compressive
     strength.